@@ -0,0 +1,18 @@
+from prisma.models import Emoji, Explanation, Session, User
+
+# Partial models let queries fetch only the columns a service actually reads.
+User.create_partial("UserId", include={"id"})
+User.create_partial("UserRole", include={"id", "role"})
+User.create_partial("UserCredentials", include={"id", "passwordHash"})
+Session.create_partial("SessionExpiry", include={"id", "expiresAt"})
+Session.create_partial(
+    "SessionWithRole",
+    include={"id", "expiresAt", "user"},
+    relations={"user": "UserRole"},
+)
+Explanation.create_partial("ExplanationContent", include={"content"})
+Emoji.create_partial(
+    "EmojiWithExplanations",
+    include={"id", "symbol", "explanations"},
+    relations={"explanations": "ExplanationContent"},
+)
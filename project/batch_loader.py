@@ -0,0 +1,63 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces lookups issued within the same event-loop tick into a single call to `batch_load`.
+
+    Results are not cached between ticks, so a module-level loader never serves stale rows.
+    """
+
+    def __init__(self, batch_load: Callable[[list[K]], Awaitable[dict[K, V]]]) -> None:
+        """
+        Args:
+            batch_load (Callable[[list[K]], Awaitable[dict[K, V]]]): Fetches all the given keys at once and returns
+                the found values by key. Missing keys resolve to None.
+        """
+        self.batch_load = batch_load
+        self.pending: dict[K, list[asyncio.Future]] = {}
+        self._scheduled = False
+        self._running: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> "asyncio.Future[V | None]":
+        """
+        Queues a lookup for `key` and returns a future resolved once the batch is flushed.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            asyncio.Future: Resolves to the value for `key`, or None if it was not found.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.setdefault(key, []).append(future)
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        batch, self.pending = self.pending, {}
+        self._scheduled = False
+        task = asyncio.ensure_future(self._resolve(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _resolve(self, batch: dict[K, list[asyncio.Future]]) -> None:
+        try:
+            found = await self.batch_load(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for key, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(found.get(key))
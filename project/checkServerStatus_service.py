@@ -1,8 +1,19 @@
+import asyncio
+import time
 from datetime import datetime
+from functools import lru_cache
 
+import project.clock
 import psutil
 from pydantic import BaseModel
 
+CPU_SAMPLE_INTERVAL = 2.0
+DISK_USAGE_TTL = 10
+
+_INV_GIB = 1.0 / (1 << 30)
+
+_last_cpu = {"value": 0.0}
+
 
 class ServerStatusRequest(BaseModel):
     """
@@ -24,7 +35,50 @@ class ServerStatusResponse(BaseModel):
     last_update_time: datetime
 
 
-def checkServerStatus(request: ServerStatusRequest) -> ServerStatusResponse:
+async def sample_cpu_forever(interval: float = CPU_SAMPLE_INTERVAL) -> None:
+    """
+    Samples CPU utilization in the background so that status requests never block on `psutil.cpu_percent`.
+
+    The first non-blocking call primes psutil's internal counters; every later call returns the utilization since the previous one.
+
+    Args:
+        interval (float): Seconds to wait between samples.
+    """
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(interval)
+        _last_cpu["value"] = psutil.cpu_percent(interval=None)
+
+
+@lru_cache(maxsize=1)
+def _memory_used(bucket: int) -> float:
+    """
+    Reads used memory, memoized per one-second `bucket` so bursts of requests share the same syscall.
+
+    Args:
+        bucket (int): The current whole second from `time.monotonic()`; only used as the cache key.
+
+    Returns:
+        float: Used memory in GB.
+    """
+    return psutil.virtual_memory().used * _INV_GIB
+
+
+@lru_cache(maxsize=1)
+def _disk_free(bucket: int) -> float:
+    """
+    Reads free disk space on the root volume, memoized per `DISK_USAGE_TTL`-second `bucket` since it rarely changes second-to-second.
+
+    Args:
+        bucket (int): The current `DISK_USAGE_TTL`-sized window of `time.monotonic()`; only used as the cache key.
+
+    Returns:
+        float: Free disk space in GB.
+    """
+    return psutil.disk_usage("/").free * _INV_GIB
+
+
+async def checkServerStatus(request: ServerStatusRequest) -> ServerStatusResponse:
     """
     This GET endpoint provides an overview of the current server status and resource utilization, meant primarily for internal monitoring and adjustment by Service Managers. It aids in scalable deployment by offering real-time data critical for efficient performance tweaking.
 
@@ -36,16 +90,29 @@ def checkServerStatus(request: ServerStatusRequest) -> ServerStatusResponse:
 
     Example:
         request = ServerStatusRequest()
-        response = checkServerStatus(request)
+        response = await checkServerStatus(request)
         # Output would include fields like CPU utilization, memory utilization, etc.
     """
-    memory = psutil.virtual_memory()
-    memory_util_in_gb = memory.used / 1024**3
-    disk = psutil.disk_usage("/")
-    disk_space_remaining_gb = disk.free / 1024**3
-    cpu_util = psutil.cpu_percent(interval=1)
+    return _status_at(int(time.monotonic()))
+
+
+@lru_cache(maxsize=1)
+def _status_at(bucket: int) -> ServerStatusResponse:
+    """
+    Builds the status response once per one-second `bucket`, so every request within that second gets the same
+    instance and the route can reuse its serialized form.
+
+    Args:
+        bucket (int): The current whole second from `time.monotonic()`.
+
+    Returns:
+        ServerStatusResponse: The server status for that second.
+    """
+    memory_util_in_gb = _memory_used(bucket)
+    disk_space_remaining_gb = _disk_free(bucket // DISK_USAGE_TTL)
+    cpu_util = _last_cpu["value"]
     network_status = "healthy"
-    last_update = datetime.now()
+    last_update = project.clock.now()
     return ServerStatusResponse(
         cpu_utilization=cpu_util,
         memory_utilization=memory_util_in_gb,
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class EmojiStatusRequest(BaseModel):
@@ -14,10 +14,15 @@ class EmojiStatusResponse(BaseModel):
     A simple response model indicating the operational status of the emoji explanation service. Expected to return an HTTP 200 status if everything is functional.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
 
 
-def checkStatus(request: EmojiStatusRequest) -> EmojiStatusResponse:
+_STATUS_OK = EmojiStatusResponse(status="Service is operational")
+
+
+async def checkStatus(request: EmojiStatusRequest) -> EmojiStatusResponse:
     """
     Provides a heartbeat or status check of the emoji explanation service. This endpoint will simply return an HTTP 200 status if the service is active, indicating that the system is ready to receive and process emojis. This endpoint is crucial for service monitoring and alerting in case of system failures.
 
@@ -29,8 +34,7 @@ def checkStatus(request: EmojiStatusRequest) -> EmojiStatusResponse:
 
     Example:
         status_request = EmojiStatusRequest()
-        status_response = checkStatus(status_request)
+        status_response = await checkStatus(status_request)
         > {'status': 'Service is operational'}
     """
-    service_operational = "Service is operational"
-    return EmojiStatusResponse(status=service_operational)
+    return _STATUS_OK
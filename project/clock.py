@@ -0,0 +1,40 @@
+import asyncio
+from datetime import datetime
+
+CLOCK_TICK_INTERVAL = 1.0
+
+_now = {"datetime": datetime.now(), "iso": datetime.now().isoformat()}
+
+
+def now() -> datetime:
+    """
+    Returns the cached wall-clock time, accurate to about `CLOCK_TICK_INTERVAL` seconds.
+
+    Returns:
+        datetime: The time of the last clock tick.
+    """
+    return _now["datetime"]
+
+
+def now_iso() -> str:
+    """
+    Returns the cached wall-clock time pre-formatted as an ISO 8601 string.
+
+    Returns:
+        str: The time of the last clock tick in ISO format.
+    """
+    return _now["iso"]
+
+
+async def tick_forever(interval: float = CLOCK_TICK_INTERVAL) -> None:
+    """
+    Refreshes the cached time in the background so monitoring endpoints can skip `datetime.now()` and formatting.
+
+    Args:
+        interval (float): Seconds to wait between ticks.
+    """
+    while True:
+        current = datetime.now()
+        _now["datetime"] = current
+        _now["iso"] = current.isoformat()
+        await asyncio.sleep(interval)
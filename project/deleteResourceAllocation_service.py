@@ -1,6 +1,7 @@
 import prisma
 import prisma.models
-from pydantic import BaseModel
+import project.explainEmoji_service
+from pydantic import BaseModel, ConfigDict
 
 
 class DeleteResourceResponse(BaseModel):
@@ -8,9 +9,15 @@ class DeleteResourceResponse(BaseModel):
     Defines the response after attempting to delete a server resource, providing either a success confirmation or details on why deletion failed.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str
 
 
+_DELETED = DeleteResourceResponse(message="Resource allocation deleted successfully.")
+_NOT_FOUND = DeleteResourceResponse(message="Resource allocation not found.")
+
+
 async def deleteResourceAllocation(resource_id: str) -> DeleteResourceResponse:
     """
     This DELETE endpoint is used by Service Managers to remove specific resource allocations which are no longer necessary. It helps in optimizing the resource usage of the server, ensuring efficient operation of the Explanation Processor by freeing up unused resources.
@@ -23,14 +30,15 @@ async def deleteResourceAllocation(resource_id: str) -> DeleteResourceResponse:
     """
     try:
         explanation = await prisma.models.Explanation.prisma().delete(
-            where={"id": resource_id}
+            where={"id": int(resource_id)}, include={"emoji": True}
         )
         if explanation:
-            return DeleteResourceResponse(
-                message="Resource allocation deleted successfully."
+            project.explainEmoji_service.invalidate_explanation(
+                explanation.emoji.symbol
             )
+            return _DELETED
         else:
-            return DeleteResourceResponse(message="Resource allocation not found.")
+            return _NOT_FOUND
     except Exception as e:
         return DeleteResourceResponse(
             message=f"Failed to delete resource allocation: {str(e)}"
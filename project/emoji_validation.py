@@ -0,0 +1,66 @@
+from functools import lru_cache
+
+import regex
+from emoji import EMOJI_DATA
+
+_EMOJI_SET = frozenset(EMOJI_DATA)
+
+# One or more complete emoji: flag pairs, keycaps, and pictographs with optional
+# variation selector / skin tone, ZWJ continuations and subdivision-flag tags.
+# Extended_Pictographic is used instead of Emoji so bare digits, '#' and '*' are rejected.
+_EMOJI_FULLMATCH = regex.compile(
+    r"(?:\p{Regional_Indicator}{2}"
+    r"|[0-9#*]\uFE0F?\u20E3"
+    r"|\p{Extended_Pictographic}[\uFE0F\p{Emoji_Modifier}]?"
+    r"(?:\u200D\p{Extended_Pictographic}[\uFE0F\p{Emoji_Modifier}]?)*"
+    r"(?:[\U000E0020-\U000E007E]+\U000E007F)?)+"
+)
+
+
+def is_emoji(character: str) -> bool:
+    """
+    Checks if the character is a recognized emoji.
+
+    Args:
+        character (str): One or more emoji, each of which may span several code points (flags, ZWJ sequences, skin tones).
+
+    Returns:
+        bool: True if the character is an emoji, False otherwise.
+    """
+    if character in _EMOJI_SET:
+        return True
+    # Every emoji contains a non-ASCII code point (keycaps end in U+20E3), so plain
+    # ASCII input is rejected by a C-level scan without touching the regex cache.
+    return not character.isascii() and _is_emoji_sequence(character)
+
+
+@lru_cache(maxsize=4096)
+def _is_emoji_sequence(text: str) -> bool:
+    """
+    Checks whether `text` is made up entirely of emoji, for inputs that are not a single known emoji.
+
+    Args:
+        text (str): The submitted string.
+
+    Returns:
+        bool: True if the whole string matches `_EMOJI_FULLMATCH`.
+    """
+    return _EMOJI_FULLMATCH.fullmatch(text) is not None
+
+
+def require_emoji(value: str) -> str:
+    """
+    Pydantic validator form of `is_emoji`, so routes can reject non-emoji input with a 422.
+
+    Args:
+        value (str): The submitted string.
+
+    Returns:
+        str: `value`, unchanged.
+
+    Raises:
+        ValueError: If `value` is not made up entirely of emoji.
+    """
+    if not is_emoji(value):
+        raise ValueError(f"{value} is not a valid emoji.")
+    return value
@@ -0,0 +1,152 @@
+import asyncio
+import functools
+
+import orjson
+import project.explainEmoji_service
+from project.emoji_validation import is_emoji
+from project.explainEmoji_service import (
+    GROQ_CLIENT,
+    GROQ_SEMAPHORE,
+    EmojiExplanationResponse,
+)
+from pydantic import BaseModel, ConfigDict
+
+MAX_BATCH_SIZE = 64
+
+
+class EmojiExplanationBatchResponse(BaseModel):
+    """
+    Model for the response containing every requested emoji with its explanation, in request order.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    explanations: list[EmojiExplanationResponse]
+
+
+async def explainEmojiBatch(emojis: list[str]) -> EmojiExplanationBatchResponse:
+    """
+    Receives up to `MAX_BATCH_SIZE` emojis and returns all their explanations. Each emoji is answered from the
+    in-memory cache or the database when possible; only the remaining ones are sent to Groq's llama3 service, together
+    in a single request. Emojis another request is already resolving join that lookup, and any the batched reply
+    leaves out are fetched one at a time. Newly fetched explanations are cached and stored in the database in the
+    background.
+
+    Args:
+        emojis (list[str]): The emojis that need explanations. Duplicates are explained once.
+
+    Returns:
+        EmojiExplanationBatchResponse: Model for the response containing every requested emoji with its explanation.
+
+    Raises:
+        ValueError: If the batch is too large or contains an invalid emoji.
+    """
+    unique = list(dict.fromkeys(emojis))
+    if len(unique) > MAX_BATCH_SIZE:
+        raise ValueError(f"At most {MAX_BATCH_SIZE} emojis can be explained at once.")
+    invalid = [emoji for emoji in unique if not is_emoji(emoji)]
+    if invalid:
+        raise ValueError(f"{', '.join(invalid)} are not valid emojis.")
+    explanations: dict[str, str] = {}
+    uncached = []
+    for emoji in unique:
+        cached = project.explainEmoji_service.get_cached_explanation(emoji)
+        if cached is None:
+            uncached.append(emoji)
+        else:
+            explanations[emoji] = cached
+    to_load = [
+        emoji
+        for emoji in uncached
+        if project.explainEmoji_service.get_inflight(emoji) is None
+    ]
+    records = await asyncio.gather(
+        *(project.explainEmoji_service.emoji_loader.load(emoji) for emoji in to_load)
+    )
+    for emoji, record in zip(to_load, records):
+        if record and record.explanations:
+            explanations[emoji] = record.explanations[0].content
+            project.explainEmoji_service.cache_explanation(emoji, explanations[emoji])
+    pending = []
+    for emoji in uncached:
+        if emoji in explanations:
+            continue
+        # Lookups that were in flight before the database round-trip may have finished and cached their result since.
+        cached = project.explainEmoji_service.get_cached_explanation(emoji)
+        if cached is None:
+            pending.append(emoji)
+        else:
+            explanations[emoji] = cached
+    inflight: dict[str, asyncio.Future[str]] = {}
+    to_fetch = []
+    for emoji in pending:
+        running = project.explainEmoji_service.get_inflight(emoji)
+        if running is None:
+            to_fetch.append(emoji)
+        else:
+            inflight[emoji] = running
+    if to_fetch:
+        batch = asyncio.ensure_future(fetch_explanations_from_groq(to_fetch))
+        for emoji in to_fetch:
+            inflight[emoji] = project.explainEmoji_service.join_inflight(
+                emoji, functools.partial(_explanation_from_batch, batch, emoji)
+            )
+    results = await asyncio.gather(
+        *(asyncio.shield(inflight[emoji]) for emoji in pending),
+        return_exceptions=True,
+    )
+    for emoji, result in zip(pending, results):
+        if isinstance(result, BaseException):
+            raise result
+        explanations[emoji] = result
+    return EmojiExplanationBatchResponse(
+        explanations=[
+            EmojiExplanationResponse(emoji=emoji, explanation=explanations[emoji])
+            for emoji in emojis
+        ]
+    )
+
+
+async def _explanation_from_batch(
+    batch: asyncio.Future[dict[str, str]], emoji: str
+) -> str:
+    """
+    Picks one emoji's explanation out of a batched Groq reply, falling back to a single-emoji request if the reply
+    left it out. The result is cached and stored in the database in the background.
+
+    Args:
+        batch (asyncio.Future[dict[str, str]]): The batched Groq request that included `emoji`.
+        emoji (str): The emoji to explain.
+
+    Returns:
+        str: The explanation text.
+    """
+    fetched = await batch
+    explanation_text = fetched.get(emoji)
+    if explanation_text is None:
+        explanation_text = (
+            await project.explainEmoji_service.fetch_explanation_from_groq(emoji)
+        )
+    project.explainEmoji_service.cache_explanation(emoji, explanation_text)
+    project.explainEmoji_service.persist_in_background(emoji, explanation_text)
+    return explanation_text
+
+
+async def fetch_explanations_from_groq(emojis: list[str]) -> dict[str, str]:
+    """
+    Fetches explanations for several emojis from the Groq llama3 service in one request.
+
+    Args:
+        emojis (list[str]): The emojis to get explanations for.
+
+    Returns:
+        dict[str, str]: The fetched explanations keyed by emoji. Emojis the service skipped are missing.
+
+    The service is asked for a structured `{"explanations": {emoji: explanation}}` body so the whole batch shares one
+    prompt and one round-trip.
+    """
+    async with GROQ_SEMAPHORE:
+        response = await GROQ_CLIENT.post("/llama3/explain", json={"emojis": emojis})
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    return result["explanations"]
@@ -1,7 +1,65 @@
+import asyncio
+import contextlib
+import logging
+from typing import Awaitable, Callable
+
 import httpx
+import orjson
 import prisma
 import prisma.models
-from pydantic import BaseModel
+import prisma.partials
+from cachetools import TTLCache
+from project.batch_loader import BatchLoader
+from project.emoji_validation import is_emoji
+from pydantic import BaseModel, ConfigDict
+
+MAX_CONCURRENT_GROQ_REQUESTS = 64
+
+GROQ_CLIENT = httpx.AsyncClient(
+    base_url="https://api.groq.com",
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+    http2=True,
+)
+GROQ_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_GROQ_REQUESTS)
+
+logger = logging.getLogger(__name__)
+
+PERSIST_ATTEMPTS = 3
+
+# Seconds the database lookup may take before a speculative Groq request is started alongside it.
+SPECULATIVE_GROQ_DELAY = 0.05
+
+# Each worker has its own cache and `invalidate_explanation` only reaches the worker that handled the delete, so
+# entries expire after EXPLANATION_CACHE_TTL seconds to bound how long the others serve a deleted explanation.
+EXPLANATION_CACHE_TTL = 300
+
+_EMOJI_CACHE: TTLCache[str, str] = TTLCache(maxsize=4096, ttl=EXPLANATION_CACHE_TTL)
+_PENDING_WRITES: set[asyncio.Task] = set()
+_INFLIGHT: dict[str, asyncio.Future[str]] = {}
+
+
+async def _load_emojis(
+    symbols: list[str],
+) -> dict[str, prisma.partials.EmojiWithExplanations]:
+    """
+    Fetches every requested emoji, with its explanations, in a single `find_many` query.
+
+    Args:
+        symbols (list[str]): The emoji symbols looked up during one event-loop tick.
+
+    Returns:
+        dict[str, prisma.partials.EmojiWithExplanations]: The found emojis keyed by symbol.
+    """
+    records = await prisma.partials.EmojiWithExplanations.prisma().find_many(
+        where={"symbol": {"in": symbols}}, include={"explanations": True}
+    )
+    return {record.symbol: record for record in records}
+
+
+emoji_loader: BatchLoader[str, prisma.partials.EmojiWithExplanations] = BatchLoader(
+    _load_emojis
+)
 
 
 class EmojiExplanationResponse(BaseModel):
@@ -9,41 +67,208 @@ class EmojiExplanationResponse(BaseModel):
     Model for the response containing the emoji with its explanation.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     emoji: str
     explanation: str
 
 
 async def explainEmoji(emoji: str) -> EmojiExplanationResponse:
     """
-    Receives an emoji and returns its explanation. It checks the database first for an existing explanation. If not found,
-    it fetches the explanation from the Groq's llama3 service using the `fetch_explanation_from_groq` function, stores
-    it in the database, and then returns the explanation.
+    Receives an emoji and returns its explanation. Explanations already served by this process are answered from an
+    in-memory cache for up to `EXPLANATION_CACHE_TTL` seconds, and concurrent misses for the same emoji share one
+    lookup. Otherwise it checks the database for an existing explanation, speculatively starting the Groq request only
+    if the lookup takes longer than `SPECULATIVE_GROQ_DELAY`; that request is cancelled if the database has an answer.
+    If not found, it fetches the explanation from the Groq's llama3 service using the `fetch_explanation_from_groq`
+    function, returns it, and stores it in the database in the background.
 
     Args:
         emoji (str): A single emoji character that needs an explanation.
 
     Returns:
         EmojiExplanationResponse: Model for the response containing the emoji with its explanation.
+
+    Raises:
+        ValueError: If `emoji` is not a valid emoji, before any database or Groq call is made.
     """
-    emoji_record = await prisma.models.Emoji.prisma().find_unique(
-        where={"symbol": emoji}, include={"explanations": True}
-    )
+    cached = _EMOJI_CACHE.get(emoji)
+    if cached is not None:
+        return EmojiExplanationResponse(emoji=emoji, explanation=cached)
+    if not is_emoji(emoji):
+        raise ValueError(f"{emoji} is not a valid emoji.")
+    inflight = join_inflight(emoji, lambda: _resolve_explanation(emoji))
+    explanation_text = await asyncio.shield(inflight)
+    return EmojiExplanationResponse(emoji=emoji, explanation=explanation_text)
+
+
+def join_inflight(
+    emoji: str, resolve: Callable[[], Awaitable[str]]
+) -> asyncio.Future[str]:
+    """
+    Returns the lookup already running for `emoji`, or starts `resolve()` as the one later callers share. Callers
+    should await the result through `asyncio.shield` so one cancelled request does not cancel it for the others.
+
+    Args:
+        emoji (str): The emoji being explained.
+        resolve (Callable[[], Awaitable[str]]): Produces the explanation when no lookup is in flight.
+
+    Returns:
+        asyncio.Future[str]: The shared lookup, removed from `_INFLIGHT` once it finishes.
+    """
+    inflight = _INFLIGHT.get(emoji)
+    if inflight is None:
+        inflight = asyncio.ensure_future(resolve())
+        _INFLIGHT[emoji] = inflight
+        inflight.add_done_callback(lambda _: _INFLIGHT.pop(emoji, None))
+    return inflight
+
+
+def get_inflight(emoji: str) -> asyncio.Future[str] | None:
+    """
+    Returns the lookup already running for `emoji`, so batch callers can join it instead of re-fetching.
+
+    Args:
+        emoji (str): The emoji to check.
+
+    Returns:
+        asyncio.Future[str] | None: The shared lookup, or None if none is in flight.
+    """
+    return _INFLIGHT.get(emoji)
+
+
+async def _resolve_explanation(emoji: str) -> str:
+    """
+    Resolves a cache miss from the database or Groq. Runs at most once at a time per emoji; concurrent callers share
+    the result through `_INFLIGHT`.
+
+    Args:
+        emoji (str): The emoji to explain.
+
+    Returns:
+        str: The explanation text.
+    """
+    lookup = emoji_loader.load(emoji)
+    groq_task = None
+    try:
+        # Groq is only called speculatively once the lookup is slower than usual, so database hits never pay for it.
+        done, _ = await asyncio.wait({lookup}, timeout=SPECULATIVE_GROQ_DELAY)
+        if not done:
+            groq_task = asyncio.create_task(fetch_explanation_from_groq(emoji))
+        emoji_record = await lookup
+    except BaseException:
+        lookup.cancel()
+        if groq_task is not None:
+            await _cancel(groq_task)
+        raise
     if emoji_record and emoji_record.explanations:
+        if groq_task is not None:
+            await _cancel(groq_task)
         explanation_text = emoji_record.explanations[0].content
     else:
-        explanation_text = await fetch_explanation_from_groq(emoji)
-        if not emoji_record:
-            emoji_record = await prisma.models.Emoji.prisma().create(
-                data={"symbol": emoji}
+        if groq_task is None:
+            groq_task = asyncio.create_task(fetch_explanation_from_groq(emoji))
+        explanation_text = await groq_task
+        persist_in_background(emoji, explanation_text)
+    _EMOJI_CACHE[emoji] = explanation_text
+    return explanation_text
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    """
+    Cancels a speculative task and waits for it to unwind, discarding its outcome.
+
+    Args:
+        task (asyncio.Task): The task to cancel.
+    """
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+
+
+def persist_in_background(emoji: str, explanation_text: str) -> None:
+    """
+    Schedules `_persist_explanation` as a tracked task that `drain_pending_writes` waits for on shutdown.
+
+    Args:
+        emoji (str): The emoji the explanation belongs to.
+        explanation_text (str): The explanation returned by Groq.
+    """
+    task = asyncio.create_task(_persist_explanation(emoji, explanation_text))
+    _PENDING_WRITES.add(task)
+    task.add_done_callback(_PENDING_WRITES.discard)
+
+
+async def _persist_explanation(emoji: str, explanation_text: str) -> None:
+    """
+    Stores a freshly fetched explanation, creating the emoji row if needed. Runs off the request path, so failures are
+    retried and logged instead of being raised to the client.
+
+    Args:
+        emoji (str): The emoji the explanation belongs to.
+        explanation_text (str): The explanation returned by Groq.
+    """
+    for attempt in range(1, PERSIST_ATTEMPTS + 1):
+        try:
+            emoji_record = await prisma.models.Emoji.prisma().upsert(
+                where={"symbol": emoji},
+                data={"create": {"symbol": emoji}, "update": {}},
             )
-        await prisma.models.Explanation.prisma().create(
-            data={
-                "content": explanation_text,
-                "emojiId": emoji_record.id,
-                "updatedBy": 1,
-            }
-        )
-    return EmojiExplanationResponse(emoji=emoji, explanation=explanation_text)
+            await prisma.models.Explanation.prisma().create(
+                data={
+                    "content": explanation_text,
+                    "emojiId": emoji_record.id,
+                    "updatedBy": 1,
+                }
+            )
+            return
+        except Exception:
+            if attempt == PERSIST_ATTEMPTS:
+                logger.exception("Failed to persist explanation for %s", emoji)
+                return
+            await asyncio.sleep(0.1 * attempt)
+
+
+async def drain_pending_writes() -> None:
+    """
+    Waits for background explanation writes to finish. Called on shutdown before the database disconnects.
+    """
+    if _PENDING_WRITES:
+        await asyncio.gather(*_PENDING_WRITES, return_exceptions=True)
+
+
+def get_cached_explanation(emoji: str) -> str | None:
+    """
+    Looks up an explanation already fetched by this process without touching the database or Groq.
+
+    Args:
+        emoji (str): The emoji to look up.
+
+    Returns:
+        str | None: The cached explanation, or None on a miss.
+    """
+    return _EMOJI_CACHE.get(emoji)
+
+
+def cache_explanation(emoji: str, explanation_text: str) -> None:
+    """
+    Stores an explanation fetched outside `explainEmoji` so later calls for the same emoji skip Groq.
+
+    Args:
+        emoji (str): The emoji the explanation belongs to.
+        explanation_text (str): The explanation returned by Groq.
+    """
+    _EMOJI_CACHE[emoji] = explanation_text
+
+
+def invalidate_explanation(emoji: str) -> None:
+    """
+    Drops a cached explanation so the next `explainEmoji` call in this process re-reads it from the database. Other
+    workers keep their copy until it expires.
+
+    Args:
+        emoji (str): The emoji whose explanation was changed or removed.
+    """
+    _EMOJI_CACHE.pop(emoji, None)
 
 
 async def fetch_explanation_from_groq(emoji: str) -> str:
@@ -56,11 +281,11 @@ async def fetch_explanation_from_groq(emoji: str) -> str:
     Returns:
         str: A fetched explanation from the Groq service.
 
-    This implementation uses HTTPX for asynchronous HTTP requests.
+    This implementation reuses the pooled HTTP/2 `GROQ_CLIENT` so connections are shared across requests, and holds
+    `GROQ_SEMAPHORE` to stay under Groq's rate limits.
     """
-    url = f"https://api.groq.com/llama3/explain?emoji={emoji}"
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        result = response.json()
-        return result["explanation"]
+    async with GROQ_SEMAPHORE:
+        response = await GROQ_CLIENT.get("/llama3/explain", params={"emoji": emoji})
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    return result["explanation"]
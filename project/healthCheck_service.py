@@ -1,6 +1,7 @@
-from datetime import datetime
+from functools import lru_cache
 
-from pydantic import BaseModel
+import project.clock
+from pydantic import BaseModel, ConfigDict
 
 
 class HealthCheckRequest(BaseModel):
@@ -16,12 +17,19 @@ class HealthCheckResponse(BaseModel):
     Response that indicates the health status of the Explanation Processor module. Primarily used by the service manager for monitoring.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     status: str
     timestamp: str
     message: str
 
 
-def healthCheck(request: HealthCheckRequest) -> HealthCheckResponse:
+_HEALTH_OK = HealthCheckResponse(
+    status="OK", timestamp="", message="Service is up and running."
+)
+
+
+async def healthCheck(request: HealthCheckRequest) -> HealthCheckResponse:
     """
     A simple health check endpoint for monitoring the status of the Explanation Processor module.
     Responds with a 200 OK status if the module is functioning correctly, otherwise it will generate
@@ -37,17 +45,29 @@ def healthCheck(request: HealthCheckRequest) -> HealthCheckResponse:
 
     Example:
         request = HealthCheckRequest()
-        response = healthCheck(request)
+        response = await healthCheck(request)
         # HealthCheckResponse(status='OK', timestamp='2023-10-10T10:00:00', message='Service is up and running.')
     """
-    time_now = datetime.now().isoformat()
+    time_now = project.clock.now_iso()
     try:
-        return HealthCheckResponse(
-            status="OK", timestamp=time_now, message="Service is up and running."
-        )
+        return _health_at(time_now)
     except Exception as error:
         return HealthCheckResponse(
             status="ERROR",
             timestamp=time_now,
             message=f"Service check failed: {str(error)}",
         )
+
+
+@lru_cache(maxsize=1)
+def _health_at(timestamp: str) -> HealthCheckResponse:
+    """
+    Returns the same healthy response for every call within one clock tick, so the route can reuse its serialized form.
+
+    Args:
+        timestamp (str): The cached clock's current ISO timestamp.
+
+    Returns:
+        HealthCheckResponse: The healthy response stamped with `timestamp`.
+    """
+    return _HEALTH_OK.model_copy(update={"timestamp": timestamp})
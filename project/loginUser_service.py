@@ -1,8 +1,11 @@
-import uuid
+import asyncio
 from datetime import datetime, timedelta
 
+import bcrypt
 import prisma
 import prisma.models
+import prisma.partials
+import project.session_token
 from pydantic import BaseModel
 
 
@@ -17,7 +20,8 @@ class UserLoginResponse(BaseModel):
 async def loginUser(username: str, password: str) -> UserLoginResponse:
     """
     This endpoint handles user login. It requires username and password, and upon successful authentication,
-    it returns a session token. This token is used for authorizing subsequent requests.
+    it returns a session token. This token is used for authorizing subsequent requests. The token is signed and carries
+    the session id and expiry, so forged or expired tokens are rejected without a database lookup.
 
     Args:
         username (str): The username for the user trying to log in.
@@ -26,15 +30,22 @@ async def loginUser(username: str, password: str) -> UserLoginResponse:
     Returns:
         UserLoginResponse: Response model for a successful user login, includes a session token for authorization.
     """
-    user = await prisma.models.User.prisma().find_unique(where={"email": username})
-    if user is None:
+    user = await prisma.partials.UserCredentials.prisma().find_unique(
+        where={"email": username}
+    )
+    if user is None or user.passwordHash is None:
         raise ValueError("User does not exist")
-    simulated_correct_password = "securepassword"
-    if password != simulated_correct_password:
+    # The bcrypt check runs outside any transaction so no connection is held for its cost.
+    if not await asyncio.to_thread(
+        bcrypt.checkpw, password.encode(), user.passwordHash.encode()
+    ):
         raise ValueError("Incorrect password")
-    session_token = str(uuid.uuid4())
-    await prisma.models.Session.prisma().create(
-        data={"userId": user.id, "expiresAt": datetime.now() + timedelta(days=1)}
+    expires_at = datetime.now() + timedelta(days=1)
+    session = await prisma.models.Session.prisma().create(
+        data={"userId": user.id, "expiresAt": expires_at}
+    )
+    session_token = project.session_token.issue(
+        session.id, user.id, expires_at.timestamp()
     )
     return UserLoginResponse(session_token=session_token)
 
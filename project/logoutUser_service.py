@@ -2,7 +2,9 @@ from datetime import datetime
 
 import prisma
 import prisma.models
-from pydantic import BaseModel
+import prisma.partials
+import project.session_token
+from pydantic import BaseModel, ConfigDict
 
 
 class LogoutResponse(BaseModel):
@@ -10,9 +12,17 @@ class LogoutResponse(BaseModel):
     Model for the response of a logout operation. Indicates success or failure of the session invalidation.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str
 
 
+_INVALID = LogoutResponse(message="Invalid session token.")
+_NO_SESSION = LogoutResponse(message="No active session found for the given token.")
+_EXPIRED = LogoutResponse(message="prisma.models.Session already expired.")
+_LOGGED_OUT = LogoutResponse(message="User successfully logged out.")
+
+
 async def logoutUser(token: str) -> LogoutResponse:
     """
     Logs out a user by invalidating their session token. Requires the current session token and responds with a success message upon successful logout.
@@ -29,16 +39,18 @@ async def logoutUser(token: str) -> LogoutResponse:
             print(response.message)
         > 'User successfully logged out.'
     """
-    try:
-        session_id = int(token)
-    except ValueError:
-        return LogoutResponse(message="Invalid session token.")
-    session = await prisma.models.Session.prisma().find_unique(where={"id": session_id})
+    claims = project.session_token.parse(token)
+    if claims is None:
+        return _INVALID
+    session = await prisma.partials.SessionExpiry.prisma().find_unique(
+        where={"id": claims.session_id}
+    )
     if not session:
-        return LogoutResponse(message="No active session found for the given token.")
-    if session.expiresAt < datetime.now():
-        return LogoutResponse(message="prisma.models.Session already expired.")
+        return _NO_SESSION
+    now = datetime.now()
+    if session.expiresAt < now:
+        return _EXPIRED
     await prisma.models.Session.prisma().update(
-        where={"id": session.id}, data={"expiresAt": datetime.now()}
+        where={"id": session.id}, data={"expiresAt": now}
     )
-    return LogoutResponse(message="User successfully logged out.")
+    return _LOGGED_OUT
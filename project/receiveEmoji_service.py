@@ -1,7 +1,8 @@
-import unicodedata
-
-import httpx
-from pydantic import BaseModel
+import orjson
+import project.explainEmoji_service
+from project.emoji_validation import is_emoji
+from project.explainEmoji_service import GROQ_CLIENT, GROQ_SEMAPHORE
+from pydantic import BaseModel, ConfigDict
 
 
 class EmojiResponseModel(BaseModel):
@@ -9,6 +10,8 @@ class EmojiResponseModel(BaseModel):
     Model for responding to the emoji input request. It provides feedback on validation success or details any error that occurred during the validation process.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     is_valid: bool
     message: str
 
@@ -37,22 +40,10 @@ async def receiveEmoji(emoji: str) -> EmojiResponseModel:
         )
 
 
-def is_emoji(character: str) -> bool:
-    """
-    Checks if the character is a recognized emoji.
-
-    Args:
-        character (str): A single Unicode character.
-
-    Returns:
-        bool: True if the character is an emoji, False otherwise.
-    """
-    return character in unicodedata.lookup("EMOJI")
-
-
 async def fetch_emoji_explanation(emoji: str) -> str:
     """
-    Fetches the explanation for the specified emoji from Groq's llama3 service.
+    Fetches the explanation for the specified emoji from Groq's llama3 service, reusing the explanation cache shared
+    with `explainEmoji` so repeated emojis skip the LLM call.
 
     Args:
         emoji (str): A valid Unicode emoji character.
@@ -60,11 +51,15 @@ async def fetch_emoji_explanation(emoji: str) -> str:
     Returns:
         str: Explanation text for the emoji or None if an error occurred.
     """
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.groq.com/llama3/explain", json={"emoji": emoji}
-        )
-        if response.status_code == 200:
-            return response.json().get("explanation")
-        else:
-            return ""
+    cached = project.explainEmoji_service.get_cached_explanation(emoji)
+    if cached is not None:
+        return cached
+    async with GROQ_SEMAPHORE:
+        response = await GROQ_CLIENT.post("/llama3/explain", json={"emoji": emoji})
+    if response.status_code == 200:
+        explanation = orjson.loads(response.content).get("explanation")
+        if explanation:
+            project.explainEmoji_service.cache_explanation(emoji, explanation)
+        return explanation
+    else:
+        return ""
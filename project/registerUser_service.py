@@ -1,10 +1,15 @@
+import asyncio
 from typing import Optional
 
+import bcrypt
 import prisma
 import prisma.enums
 import prisma.models
+import prisma.partials
 from pydantic import BaseModel
 
+BCRYPT_ROUNDS = 10
+
 
 class UserRegistrationResponse(BaseModel):
     """
@@ -23,7 +28,7 @@ async def registerUser(
     This endpoint is used for registering a new user. It accepts user details such as username, password, and email. It returns a success message with a user ID if the registration is successful. Supports user role assignment during registration process if specified.
 
     Args:
-        username (str): Desired username for the new account.
+        username (str): Desired username for the new account. It is not stored; accounts are identified by email.
         password (str): Secure password for the new account. It should meet the complexity requirements set by the system's security policy.
         email (str): Email address for the user. This will be used for communication and password recovery where necessary.
         role (Optional[prisma.enums.Role]): The role assigned to the user at registration. If not provided, defaults to 'USER'.
@@ -31,7 +36,7 @@ async def registerUser(
     Returns:
         UserRegistrationResponse: This model packages the response after a successful user registration. It includes the new user's ID, indicating successful registration or an appropriate error message.
     """
-    existing_user = await prisma.models.User.prisma().find_unique(
+    existing_user = await prisma.partials.UserId.prisma().find_unique(
         where={"email": email}
     )
     if existing_user:
@@ -41,10 +46,12 @@ async def registerUser(
         )
     final_role = role if role is not None else prisma.enums.Role.USER
     try:
+        password_hash = await asyncio.to_thread(
+            bcrypt.hashpw, password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)
+        )
         new_user = await prisma.models.User.prisma().create(
             data={
-                "username": username,
-                "password": password,
+                "passwordHash": password_hash.decode(),
                 "email": email,
                 "role": final_role,
             }
@@ -1,12 +1,17 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Annotated, Optional
 
 import prisma
 import prisma.enums
 import project.checkServerStatus_service
 import project.checkStatus_service
+import project.clock
 import project.deleteResourceAllocation_service
+import project.explainEmojiBatch_service
 import project.explainEmoji_service
 import project.healthCheck_service
 import project.loginUser_service
@@ -16,119 +21,170 @@ import project.registerUser_service
 import project.updateServerResources_service
 import project.updateUserRole_service
 import project.verifySession_service
-from fastapi import FastAPI
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import Response
+from fastapi import Body, Depends, FastAPI, Query, Request
+from fastapi.responses import ORJSONResponse, Response
 from prisma import Prisma
+from project.emoji_validation import require_emoji
+from pydantic import AfterValidator, BaseModel
 
 logger = logging.getLogger(__name__)
 
+DB_CONNECT_ATTEMPTS = 5
+
+# Malformed input is rejected with a 422 before reaching a service.
+EmojiParam = Annotated[str, Query(min_length=1, max_length=32)]
+ExplainableEmojiParam = Annotated[EmojiParam, AfterValidator(require_emoji)]
+SessionTokenParam = Annotated[
+    str, Query(max_length=256, pattern=r"^[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+$")
+]
+
 db_client = Prisma(auto_register=True)
 
 
+class CachedJSON:
+    """
+    Serves a monitoring response from pre-serialized bytes, re-encoding only when the service hands back a different
+    instance. Responses carry `Cache-Control` and an `ETag`, and a matching `If-None-Match` gets an empty 304.
+    """
+
+    def __init__(self, max_age: int) -> None:
+        self.cache_control = f"max-age={max_age}"
+        self._model: BaseModel | None = None
+        self._body = b""
+        self._etag = ""
+
+    def respond(self, model: BaseModel, request: Request) -> Response:
+        if model is not self._model:
+            self._body = model.model_dump_json().encode()
+            self._etag = f'"{hashlib.blake2b(self._body, digest_size=8).hexdigest()}"'
+            self._model = model
+        headers = {"Cache-Control": self.cache_control, "ETag": self._etag}
+        if request.headers.get("if-none-match") == self._etag:
+            return Response(status_code=304, headers=headers)
+        return Response(self._body, media_type="application/json", headers=headers)
+
+
+_status_json = CachedJSON(max_age=5)
+_health_json = CachedJSON(max_age=1)
+_server_status_json = CachedJSON(max_age=1)
+
+
+async def connect_db_with_retry() -> None:
+    """
+    Connects the Prisma client, retrying with a linear backoff while the database (or PgBouncer) is still starting.
+    """
+    for attempt in range(1, DB_CONNECT_ATTEMPTS + 1):
+        try:
+            await db_client.connect()
+            return
+        except Exception:
+            if attempt == DB_CONNECT_ATTEMPTS:
+                raise
+            logger.warning("Database connection attempt %d failed, retrying", attempt)
+            await asyncio.sleep(attempt)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await db_client.connect()
+    await connect_db_with_retry()
+    background_tasks = [
+        asyncio.create_task(project.checkServerStatus_service.sample_cpu_forever()),
+        asyncio.create_task(project.clock.tick_forever()),
+    ]
     yield
+    for task in background_tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await project.explainEmoji_service.GROQ_CLIENT.aclose()
+    await project.explainEmoji_service.drain_pending_writes()
     await db_client.disconnect()
 
 
 app = FastAPI(
     title="emoji explainer",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     description="create an endpoint that takes an emoji as an input and returns it's explaination.  Use Groq, specifically llama3 for the explanaition",
 )
 
 
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Turns any exception escaping a route into a JSON 500 carrying the error message. Starlette re-raises the exception once this response is sent, so the server logs the traceback itself and nothing is logged here.
+    """
+    return ORJSONResponse({"error": str(exc)}, status_code=500)
+
+
 @app.post(
     "/emoji/explain",
     response_model=project.explainEmoji_service.EmojiExplanationResponse,
 )
 async def api_post_explainEmoji(
-    emoji: str,
-) -> project.explainEmoji_service.EmojiExplanationResponse | Response:
+    emoji: ExplainableEmojiParam,
+) -> project.explainEmoji_service.EmojiExplanationResponse:
     """
     Receives an emoji via POST request and returns its explanation. The emoji is validated by the Input Handler before being processed. This route utilizes the llama3 technology from Groq to fetch the explanation. The expected response is a JSON object containing the original emoji and its explanation. The route is designed to handle requests efficiently, ensuring that the emoji is valid and delegating processing power requisition to Server Management.
     """
-    try:
-        res = await project.explainEmoji_service.explainEmoji(emoji)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.explainEmoji_service.explainEmoji(emoji)
+    return res
+
+
+@app.post(
+    "/emoji/explain_batch",
+    response_model=project.explainEmojiBatch_service.EmojiExplanationBatchResponse,
+)
+async def api_post_explainEmojiBatch(
+    emojis: Annotated[
+        list[Annotated[str, AfterValidator(require_emoji)]],
+        Body(min_length=1, max_length=project.explainEmojiBatch_service.MAX_BATCH_SIZE),
+    ],
+) -> project.explainEmojiBatch_service.EmojiExplanationBatchResponse:
+    """
+    Receives a list of emojis via POST request and returns all their explanations in one response. Cached and stored explanations are served directly, and the rest are fetched from Groq's llama3 in a single batched request.
+    """
+    res = await project.explainEmojiBatch_service.explainEmojiBatch(emojis)
+    return res
 
 
 @app.get(
     "/api/emoji/status", response_model=project.checkStatus_service.EmojiStatusResponse
 )
 async def api_get_checkStatus(
-    request: project.checkStatus_service.EmojiStatusRequest,
+    request: Annotated[project.checkStatus_service.EmojiStatusRequest, Depends()],
+    http_request: Request,
 ) -> project.checkStatus_service.EmojiStatusResponse | Response:
     """
     Provides a heartbeat or status check of the emoji explanation service. This endpoint will simply return an HTTP 200 status if the service is active, indicating that the system is ready to receive and process emojis. This endpoint is crucial for service monitoring and alerting in case of system failures.
     """
-    try:
-        res = project.checkStatus_service.checkStatus(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.checkStatus_service.checkStatus(request)
+    return _status_json.respond(res, http_request)
 
 
 @app.get("/health", response_model=project.healthCheck_service.HealthCheckResponse)
 async def api_get_healthCheck(
-    request: project.healthCheck_service.HealthCheckRequest,
+    request: Annotated[project.healthCheck_service.HealthCheckRequest, Depends()],
+    http_request: Request,
 ) -> project.healthCheck_service.HealthCheckResponse | Response:
     """
     A simple health check endpoint for monitoring the status of the Explanation Processor module. Responds with a 200 OK status if the module is functioning correctly, otherwise it will generate relevant error statuses. This is crucial for ongoing maintenance and monitoring by the Service Manager role.
     """
-    try:
-        res = project.healthCheck_service.healthCheck(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.healthCheck_service.healthCheck(request)
+    return _health_json.respond(res, http_request)
 
 
 @app.post(
     "/api/emoji/receive", response_model=project.receiveEmoji_service.EmojiResponseModel
 )
 async def api_post_receiveEmoji(
-    emoji: str,
-) -> project.receiveEmoji_service.EmojiResponseModel | Response:
+    emoji: EmojiParam,
+) -> project.receiveEmoji_service.EmojiResponseModel:
     """
     Receives an emoji character from a user, validates it to ensure it's a proper emoji, and sends it to the Explanation Processor module. The emoji should be a valid Unicode character recognized as an emoji. If the validation is successful, the emoji is sent using an internal API call to Groq's llama3 for further explanation. The route should be able to handle a JSON request containing the emoji and respond with either a success or an error message detailing the validation outcome.
     """
-    try:
-        res = await project.receiveEmoji_service.receiveEmoji(emoji)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.receiveEmoji_service.receiveEmoji(emoji)
+    return res
 
 
 @app.delete(
@@ -137,45 +193,25 @@ async def api_post_receiveEmoji(
 )
 async def api_delete_deleteResourceAllocation(
     resource_id: str,
-) -> project.deleteResourceAllocation_service.DeleteResourceResponse | Response:
+) -> project.deleteResourceAllocation_service.DeleteResourceResponse:
     """
     This DELETE endpoint is used by Service Managers to remove specific resource allocations which are no longer necessary. It helps in optimizing the resource usage of the server, ensuring efficient operation of the Explanation Processor by freeing up unused resources.
     """
-    try:
-        res = await project.deleteResourceAllocation_service.deleteResourceAllocation(
-            resource_id
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.deleteResourceAllocation_service.deleteResourceAllocation(
+        resource_id
+    )
+    return res
 
 
 @app.post("/users/logout", response_model=project.logoutUser_service.LogoutResponse)
 async def api_post_logoutUser(
-    token: str,
-) -> project.logoutUser_service.LogoutResponse | Response:
+    token: SessionTokenParam,
+) -> project.logoutUser_service.LogoutResponse:
     """
     Logs out a user by invalidating their session token. Requires the current session token and responds with a success message upon successful logout.
     """
-    try:
-        res = await project.logoutUser_service.logoutUser(token)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.logoutUser_service.logoutUser(token)
+    return res
 
 
 @app.get(
@@ -183,77 +219,58 @@ async def api_post_logoutUser(
     response_model=project.checkServerStatus_service.ServerStatusResponse,
 )
 async def api_get_checkServerStatus(
-    request: project.checkServerStatus_service.ServerStatusRequest,
+    request: Annotated[
+        project.checkServerStatus_service.ServerStatusRequest, Depends()
+    ],
+    http_request: Request,
 ) -> project.checkServerStatus_service.ServerStatusResponse | Response:
     """
     This GET endpoint provides an overview of the current server status and resource utilization, meant primarily for internal monitoring and adjustment by Service Managers. It aids in scalable deployment by offering real-time data critical for efficient performance tweaking.
     """
-    try:
-        res = project.checkServerStatus_service.checkServerStatus(request)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.checkServerStatus_service.checkServerStatus(request)
+    return _server_status_json.respond(res, http_request)
 
 
+# Routes whose services build responses with model_construct set response_model=None so FastAPI does not
+# revalidate them; `responses` keeps the schema in the OpenAPI docs.
 @app.put(
     "/users/role/update",
-    response_model=project.updateUserRole_service.UserRoleUpdateResponse,
+    response_model=None,
+    responses={200: {"model": project.updateUserRole_service.UserRoleUpdateResponse}},
 )
 async def api_put_updateUserRole(
     userId: int, newRole: str
-) -> project.updateUserRole_service.UserRoleUpdateResponse | Response:
+) -> project.updateUserRole_service.UserRoleUpdateResponse:
     """
     Updates the role of a specific user. This is typically used by administrators to elevate privileges or change user roles. Requires admin privileges and the targeted user's ID along with the new role.
     """
-    try:
-        res = await project.updateUserRole_service.updateUserRole(userId, newRole)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.updateUserRole_service.updateUserRole(userId, newRole)
+    return res
 
 
 @app.patch(
     "/api/server/update",
-    response_model=project.updateServerResources_service.ServerResourceUpdateResponse,
+    response_model=None,
+    responses={
+        200: {
+            "model": project.updateServerResources_service.ServerResourceUpdateResponse
+        }
+    },
 )
 async def api_patch_updateServerResources(
     cpu_allocation_increment: float,
     ram_allocation_increment: float,
     disk_space_allocation_increment: float,
-) -> project.updateServerResources_service.ServerResourceUpdateResponse | Response:
+) -> project.updateServerResources_service.ServerResourceUpdateResponse:
     """
     Through this PATCH route, Service Managers can update server resource allocations based on current demand and predictive data analytics from the Server Management module. The endpoint accepts parameters for resource adjustments and applies them immediately to maintain service quality.
     """
-    try:
-        res = project.updateServerResources_service.updateServerResources(
-            cpu_allocation_increment,
-            ram_allocation_increment,
-            disk_space_allocation_increment,
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.updateServerResources_service.updateServerResources(
+        cpu_allocation_increment,
+        ram_allocation_increment,
+        disk_space_allocation_increment,
+    )
+    return res
 
 
 @app.post(
@@ -262,66 +279,37 @@ async def api_patch_updateServerResources(
 )
 async def api_post_registerUser(
     username: str, password: str, email: str, role: Optional[prisma.enums.Role]
-) -> project.registerUser_service.UserRegistrationResponse | Response:
+) -> project.registerUser_service.UserRegistrationResponse:
     """
     This endpoint is used for registering a new user. It accepts user details such as username, password, and email. It returns a success message with a user ID if the registration is successful. Supports user role assignment during registration process if specified.
     """
-    try:
-        res = await project.registerUser_service.registerUser(
-            username, password, email, role
-        )
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.registerUser_service.registerUser(
+        username, password, email, role
+    )
+    return res
 
 
 @app.get(
     "/users/session/verify",
-    response_model=project.verifySession_service.SessionVerifyResponse,
+    response_model=None,
+    responses={200: {"model": project.verifySession_service.SessionVerifyResponse}},
 )
 async def api_get_verifySession(
-    session_token: str,
-) -> project.verifySession_service.SessionVerifyResponse | Response:
+    session_token: SessionTokenParam,
+) -> project.verifySession_service.SessionVerifyResponse:
     """
     Verifies the validity of a user's session token. It is used by various modules to ensure that user requests are authenticated. The endpoint checks the provided session token and returns the validation status.
     """
-    try:
-        res = await project.verifySession_service.verifySession(session_token)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.verifySession_service.verifySession(session_token)
+    return res
 
 
 @app.post("/users/login", response_model=project.loginUser_service.UserLoginResponse)
 async def api_post_loginUser(
     username: str, password: str
-) -> project.loginUser_service.UserLoginResponse | Response:
+) -> project.loginUser_service.UserLoginResponse:
     """
     This endpoint handles user login. It requires username and password, and upon successful authentication, it returns a session token. This token is used for authorizing subsequent requests.
     """
-    try:
-        res = await project.loginUser_service.loginUser(username, password)
-        return res
-    except Exception as e:
-        logger.exception("Error processing request")
-        res = dict()
-        res["error"] = str(e)
-        return Response(
-            content=jsonable_encoder(res),
-            status_code=500,
-            media_type="application/json",
-        )
+    res = await project.loginUser_service.loginUser(username, password)
+    return res
@@ -0,0 +1,76 @@
+import base64
+import hashlib
+import hmac
+import os
+import time
+from typing import NamedTuple
+
+# Every worker and replica must sign with the same key, so a missing secret stops the app at import time.
+_SECRET = os.environ.get("SESSION_SECRET", "").encode()
+if not _SECRET:
+    raise RuntimeError("SESSION_SECRET must be set to verify session tokens")
+
+
+class SessionClaims(NamedTuple):
+    session_id: int
+    user_id: int
+    expires_at: float
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_SECRET, payload, hashlib.sha256).digest()
+
+
+def issue(session_id: int, user_id: int, expires_at: float) -> str:
+    """
+    Creates a self-describing session token signed with HMAC-SHA256. The user's role is deliberately left out, so a
+    role change takes effect on the next verification instead of when the token expires.
+
+    Args:
+        session_id (int): The id of the backing `Session` row, which logout expires to revoke the token.
+        user_id (int): The id of the logged-in user.
+        expires_at (float): Unix timestamp after which the token is rejected.
+
+    Returns:
+        str: The token, as `<payload>.<signature>` in URL-safe base64.
+    """
+    payload = f"{session_id}:{user_id}:{expires_at:.0f}".encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def parse(token: str) -> SessionClaims | None:
+    """
+    Checks a token's signature and expiry without touching the database. Logged-out sessions are only visible in the
+    `Session` table, so callers that must honour logout check the row as well.
+
+    Args:
+        token (str): A token created by `issue`.
+
+    Returns:
+        SessionClaims | None: The embedded claims, or None if the token is malformed, forged or expired.
+    """
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except ValueError:
+        return None
+    if not hmac.compare_digest(signature, _sign(payload)):
+        return None
+    try:
+        session_id, user_id, expires_at = payload.decode().split(":")
+        claims = SessionClaims(int(session_id), int(user_id), float(expires_at))
+    except ValueError:
+        # Correctly signed but in an older layout, e.g. one that still carried the role.
+        return None
+    if claims.expires_at < time.time():
+        return None
+    return claims
@@ -1,5 +1,14 @@
+import prisma
+import prisma.models
 from pydantic import BaseModel
 
+# CPU (%), RAM (GB) and disk (GB) allocations before the first update is stored.
+BASELINE_CPU = 100.0
+BASELINE_RAM = 40.0
+BASELINE_DISK = 200.0
+
+ALLOCATION_ROW_ID = 1
+
 
 class ServerResourceUpdateResponse(BaseModel):
     """
@@ -12,13 +21,13 @@ class ServerResourceUpdateResponse(BaseModel):
     message: str
 
 
-def updateServerResources(
+async def updateServerResources(
     cpu_allocation_increment: float,
     ram_allocation_increment: float,
     disk_space_allocation_increment: float,
 ) -> ServerResourceUpdateResponse:
     """
-    Through this PATCH route, Service Managers can update server resource allocations based on current demand and predictive data analytics from the Server Management module. The endpoint accepts parameters for resource adjustments and applies them immediately to maintain service quality.
+    Through this PATCH route, Service Managers can update server resource allocations based on current demand and predictive data analytics from the Server Management module. The endpoint accepts parameters for resource adjustments and applies them immediately to maintain service quality. Adjustments are applied as atomic increments on a single `ServerAllocation` row, so they accumulate across calls, workers and restarts.
 
     Args:
     cpu_allocation_increment (float): The increment or decrement value to adjust the CPU resources by, in percentage points. Positive values increase allocation, negative values decrease it.
@@ -29,7 +38,7 @@ def updateServerResources(
     ServerResourceUpdateResponse: This model encapsulates the response after the server resource adjustments are made. It provides confirmation and the new state of the resources.
 
     Example:
-        updateServerResources(10, 5, 20)
+        await updateServerResources(10, 5, 20)
         > ServerResourceUpdateResponse(
             cpu_updated_allocation=110, # assuming initial was 100%
             ram_updated_allocation=45, # assuming initial was 40GB
@@ -37,15 +46,25 @@ def updateServerResources(
             message="Server resources successfully updated."
           )
     """
-    current_cpu = 100
-    current_ram = 40
-    current_disk = 200
-    updated_cpu = current_cpu + cpu_allocation_increment
-    updated_ram = current_ram + ram_allocation_increment
-    updated_disk = current_disk + disk_space_allocation_increment
-    return ServerResourceUpdateResponse(
-        cpu_updated_allocation=updated_cpu,
-        ram_updated_allocation=updated_ram,
-        disk_space_updated_allocation=updated_disk,
+    allocation = await prisma.models.ServerAllocation.prisma().upsert(
+        where={"id": ALLOCATION_ROW_ID},
+        data={
+            "create": {
+                "id": ALLOCATION_ROW_ID,
+                "cpuPercent": BASELINE_CPU + cpu_allocation_increment,
+                "ramGb": BASELINE_RAM + ram_allocation_increment,
+                "diskSpaceGb": BASELINE_DISK + disk_space_allocation_increment,
+            },
+            "update": {
+                "cpuPercent": {"increment": cpu_allocation_increment},
+                "ramGb": {"increment": ram_allocation_increment},
+                "diskSpaceGb": {"increment": disk_space_allocation_increment},
+            },
+        },
+    )
+    return ServerResourceUpdateResponse.model_construct(
+        cpu_updated_allocation=allocation.cpuPercent,
+        ram_updated_allocation=allocation.ramGb,
+        disk_space_updated_allocation=allocation.diskSpaceGb,
         message="Server resources successfully updated.",
     )
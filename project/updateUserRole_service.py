@@ -1,5 +1,6 @@
 import prisma
 import prisma.models
+import prisma.partials
 from pydantic import BaseModel
 
 
@@ -29,12 +30,13 @@ async def updateUserRole(userId: int, newRole: str) -> UserRoleUpdateResponse:
         print(updated_user)
         > UserRoleUpdateResponse(userId=3, updatedRole='ADMIN', status='Success')
     """
-    user = await prisma.models.User.prisma().find_unique(where={"id": userId})
-    if not user:
-        return UserRoleUpdateResponse(
+    updated_user = await prisma.partials.UserRole.prisma().update(
+        where={"id": userId}, data={"role": newRole}
+    )
+    if updated_user is None:
+        return UserRoleUpdateResponse.model_construct(
             userId=userId, updatedRole="", status="User not found"
         )
-    updated_user = await prisma.models.User.prisma().update(
-        where={"id": userId}, data={"role": newRole}
+    return UserRoleUpdateResponse.model_construct(
+        userId=updated_user.id, updatedRole=updated_user.role, status="Success"
     )
-    return UserRoleUpdateResponse(userId=userId, updatedRole=newRole, status="Success")
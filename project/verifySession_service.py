@@ -1,9 +1,12 @@
 from datetime import datetime
+from typing import Optional
 
 import prisma
 import prisma.enums
-import prisma.models
-from pydantic import BaseModel
+import prisma.partials
+import project.session_token
+from project.batch_loader import BatchLoader
+from pydantic import BaseModel, ConfigDict
 
 
 class SessionVerifyResponse(BaseModel):
@@ -11,8 +14,13 @@ class SessionVerifyResponse(BaseModel):
     Response model for the session verification process. It will indicate whether the session token is valid or not.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     is_valid: bool
-    user_role: prisma.enums.Role
+    user_role: Optional[prisma.enums.Role] = None
+
+
+_INVALID = SessionVerifyResponse(is_valid=False, user_role=None)
 
 
 class Role(BaseModel):
@@ -21,9 +29,32 @@ class Role(BaseModel):
     SERVICE_MANAGER: str = "SERVICE_MANAGER"
 
 
+async def _load_sessions(
+    session_ids: list[int],
+) -> dict[int, prisma.partials.SessionWithRole]:
+    """
+    Fetches every requested session, with its user's current role, in a single `find_many` query.
+
+    Args:
+        session_ids (list[int]): The session ids looked up during one event-loop tick.
+
+    Returns:
+        dict[int, prisma.partials.SessionWithRole]: The found sessions keyed by id.
+    """
+    sessions = await prisma.partials.SessionWithRole.prisma().find_many(
+        where={"id": {"in": session_ids}}, include={"user": True}
+    )
+    return {session.id: session for session in sessions}
+
+
+session_loader: BatchLoader[int, prisma.partials.SessionWithRole] = BatchLoader(
+    _load_sessions
+)
+
+
 async def verifySession(session_token: str) -> SessionVerifyResponse:
     """
-    Verifies the validity of a user's session token. It is used by various modules to ensure that user requests are authenticated. The endpoint checks the provided session token and returns the validation status.
+    Verifies the validity of a user's session token. It is used by various modules to ensure that user requests are authenticated. The endpoint checks the provided session token and returns the validation status. Forged and expired tokens are rejected from their signature alone; otherwise the session row and its user's current role are read through `session_loader`, so a logout or role change on any worker takes effect immediately.
 
     Args:
         session_token (str): The session token that needs to be verified to ensure it's valid and active.
@@ -31,13 +62,13 @@ async def verifySession(session_token: str) -> SessionVerifyResponse:
     Returns:
         SessionVerifyResponse: Response model for the session verification process. It will indicate whether the session token is valid or not.
     """
-    session = await prisma.models.Session.prisma().find_unique(
-        where={"id": int(session_token)}
-    )
+    claims = project.session_token.parse(session_token)
+    if claims is None:
+        return _INVALID
+    session = await session_loader.load(claims.session_id)
     if session and session.expiresAt >= datetime.now():
-        user = await prisma.models.User.prisma().find_unique(
-            where={"id": session.userId}
+        return SessionVerifyResponse.model_construct(
+            is_valid=True, user_role=session.user.role
         )
-        return SessionVerifyResponse(is_valid=True, user_role=user.role)
     else:
-        return SessionVerifyResponse(is_valid=False, user_role=None)
+        return _INVALID